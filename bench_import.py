@@ -0,0 +1,68 @@
+"""Startup benchmark based on python -X importtime.
+
+Every measurement imports one statement in a fresh interpreter and reads the cumulative import time of the
+top level modules from stderr. The median of several runs is reported to smooth out disk and scheduler noise.
+
+    python bench_import.py
+    python bench_import.py "import slider" "from widgets import Button" --runs 20
+"""
+
+import argparse
+import os
+import pathlib
+import re
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import button",
+    "import slider",
+    "import data_input",
+    "import charts",
+    "import histogram_slider",
+    "import icon_picker",
+    "import widgets",
+    "from widgets import Button",
+]
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(statement: str, python: str = sys.executable) -> float:
+    """Returns the cumulative import time of statement in milliseconds, measured in a fresh interpreter."""
+    environment = dict(os.environ, PYTHONPATH=str(pathlib.Path(__file__).parent), QT_QPA_PLATFORM="offscreen")
+    process = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=environment,
+        cwd=pathlib.Path(__file__).parent,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    total = 0
+    for match in _LINE.finditer(process.stderr):
+        if len(match.group(3)) == 1:
+            total += int(match.group(2))
+    return total / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure import times of the widget modules.")
+    parser.add_argument("statements", nargs="*", default=STATEMENTS, help="Import statements to measure.")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="Number of fresh interpreters per statement.")
+    arguments = parser.parse_args()
+
+    measure("import PySide6.QtWidgets")
+
+    width = max(len(statement) for statement in arguments.statements)
+    print(f"{'statement':<{width}}  {'median':>9}  {'min':>9}")
+    for statement in arguments.statements:
+        timings = [measure(statement) for _ in range(arguments.runs)]
+        print(f"{statement:<{width}}  {statistics.median(timings):>7.1f}ms  {min(timings):>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
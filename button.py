@@ -1,5 +1,4 @@
-import sys
-from PySide6.QtWidgets import QApplication, QPushButton, QWidget, QGridLayout
+from PySide6.QtWidgets import QPushButton, QWidget
 from PySide6.QtGui import (
     QColor,
     QPainter,
@@ -10,11 +9,10 @@ from PySide6.QtGui import (
     QPainterPath,
     QFontMetrics,
     QFont,
-    QKeySequence,
 )
 from PySide6.QtCore import Qt, QRect, QPoint, QEvent, QSize, QPropertyAnimation, QEasingCurve
 
-from utils import load_svg, draw_svg
+from utils import load_svg, draw_svg, draw_static_text
 
 
 class Button(QPushButton):
@@ -280,9 +278,7 @@ class Button(QPushButton):
 
         painter.setPen(QPen(self.__get_secondary_color()))
         painter.setFont(self.font())
-        painter.drawText(
-            self.__text_rect(), Qt.AlignmentFlag.AlignCenter, self.text() if (not self._error or self._error_text is None) else self._error_text
-        )
+        draw_static_text(painter, self.__text_rect(), self.text() if (not self._error or self._error_text is None) else self._error_text)
 
         painter.setBrush(Qt.BrushStyle.NoBrush)
 
@@ -294,51 +290,3 @@ class Button(QPushButton):
 
         elif self._alternate_svg and self.isChecked():
             draw_svg(painter, self._alternate_svg, self.iconSize(), self.__svg_rect(), self.__get_secondary_color())
-
-
-def main():
-    app = QApplication(sys.argv)
-    w = QWidget()
-    w.setLayout(QGridLayout())
-    w.layout().setAlignment(Qt.AlignmentFlag.AlignTop)
-
-    b1 = Button("Zoom in", "zoom-in")
-    b1.primary_color = QColor("#34495e")
-
-    b2 = Button("Zoom out", "zoom-out")
-    b2.primary_color = QColor("#34495e")
-
-    b3 = Button("Test", "zap")
-    b3.primary_color = QColor("#f26957")
-
-    b4 = Button("Test", "briefcase")
-    b4.primary_color = QColor("#3265d1")
-
-    b5 = Button("Test")
-
-    b6 = Button("Test", "chevron-down")
-    b6.set_svg("chevron-up", True)
-    b6.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
-
-    b7 = Button("Datei auswählen", "file-csv")
-    b7.primary_color = QColor("#af51cf")
-    b4.clicked.connect(lambda: b7.set_error(not b7._error, "Falscher Dateityp!"))
-
-    b8 = Button("Test", "volume")
-    b8.setCheckable(True)
-    b8.set_svg("volume-x", True)
-
-    w.layout().addWidget(b1, 0, 0)
-    w.layout().addWidget(b2, 0, 1)
-    w.layout().addWidget(b3, 1, 0)
-    w.layout().addWidget(b4, 1, 1)
-    w.layout().addWidget(b5, 2, 0)
-    w.layout().addWidget(b6, 2, 1)
-    w.layout().addWidget(b7, 3, 0)
-    w.layout().addWidget(b8, 3, 1)
-    w.show()
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()
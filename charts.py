@@ -1,19 +1,102 @@
-import PySide6
 from PySide6.QtWidgets import QWidget, QGraphicsView, QGraphicsScene
-from PySide6.QtCore import Qt, QSize, QPoint, QRect
-from PySide6.QtGui import QColor, QPainter, QPaintEvent, QMouseEvent, QPainterPath, QPen, QBrush, QResizeEvent
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QColor, QPainterPath, QPen, QBrush, QResizeEvent, QFontMetrics
+
+from math import sin, cos, pi, degrees
+from typing import NamedTuple
+
+
+class LabelPlacement(NamedTuple):
+    text: str
+    anchor: tuple[float, float]
+    elbow: tuple[float, float]
+    position: tuple[float, float]
+    right: bool
+
+
+def place_labels(
+    angles: list[float],
+    weights: list[float],
+    texts: list[str],
+    center: tuple[float, float],
+    radius: float,
+    line_height: float,
+    top: float,
+    bottom: float,
+    leader_length: float = 16,
+    other_text: str = "+{} more",
+) -> list[LabelPlacement]:
+    """Places outside labels with leader lines so that labels on the same side of the chart never overlap.
+
+    Labels are split by side and sorted by their ideal height, then a downward and an upward sweep push
+    overlapping labels apart, which keeps the layout at O(n log n). When a side has more labels than fit
+    between top and bottom, the labels of the smallest slices are merged into a single other_text label.
+
+    Args:
+        angles        (list[float]): Middle angle of every slice in radians, counterclockwise from 3 o'clock.
+        weights       (list[float]): Slice values, labels of small slices are merged first.
+        texts         (list[str])  : Label texts.
+        center        (tuple)      : Center of the chart.
+        radius        (float)      : Outer radius of the chart.
+        line_height   (float)      : Height reserved per label.
+        top           (float)      : Highest allowed label position.
+        bottom        (float)      : Lowest allowed label position.
+        leader_length (float)      : Distance between the chart and the labels.
+    """
+    cx, cy = center
+    capacity = max(int((bottom - top) // line_height), 0)
+    placements = []
+
+    for right in (True, False):
+        side = [index for index, angle in enumerate(angles) if (cos(angle) >= 0) == right]
+        if not side or not capacity:
+            continue
+
+        merged = []
+        if len(side) > capacity:
+            by_weight = sorted(side, key=lambda index: weights[index], reverse=True)
+            side, merged = by_weight[: capacity - 1], by_weight[capacity - 1 :]
+            representative = max(merged, key=lambda index: weights[index])
+            side.append(representative)
+
+        def ideal_y(index: int) -> float:
+            return cy - (radius + leader_length / 2) * sin(angles[index]) - line_height / 2
+
+        side.sort(key=ideal_y)
+        positions = []
+        for index in side:
+            y = max(ideal_y(index), top, positions[-1] + line_height if positions else top)
+            positions.append(y)
+        limit = bottom - line_height
+        for i in range(len(positions) - 1, -1, -1):
+            positions[i] = min(positions[i], limit)
+            limit = positions[i] - line_height
+
+        for index, y in zip(side, positions):
+            text = texts[index] if not merged or index != representative else other_text.format(len(merged))
+            anchor = cx + radius * cos(angles[index]), cy - radius * sin(angles[index])
+            elbow = cx + (radius + leader_length / 2) * cos(angles[index]), y + line_height / 2
+            x = cx + radius + leader_length if right else cx - radius - leader_length
+            placements.append(LabelPlacement(text, anchor, elbow, (x, y), right))
+
+    return placements
 
-from math import sin, cos, pi, degrees, radians
 
 class PieChart(QGraphicsView):
 
     padding: int = 16
+    leader_length: int = 16
+    label_color: QColor = QColor("#3d3d3d")
 
     def __init__(self, values: list[float], labels: list[str] = None, parent: QWidget = None) -> None:
         super().__init__(parent)
 
         self._values = values
         self._labels = labels if labels is not None else []
+        self._revision = 0
+
+        self._label_layout_key = None
+        self._label_layout = []
 
     
         self._scene = QGraphicsScene()
@@ -21,46 +104,102 @@ class PieChart(QGraphicsView):
         self._start_angle = pi / 2
         self._inner_radius_percent = 0.7
         self.setScene(self._scene)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.draw_arcs()
 
 
+    def set_data(self, values: list[float], labels: list[str] = None) -> None:
+        self._values = list(values)
+        self._labels = list(labels) if labels is not None else []
+        self._revision += 1
+        self.draw_arcs()
+
+    def set_totals(self, totals: dict) -> None:
+        self.set_data(list(totals.values()), [str(label) for label in totals])
+
+    def revision(self) -> int:
+        return self._revision
+
+    def __label_width(self) -> int:
+        if not self._labels:
+            return 0
+        metrics = QFontMetrics(self.font())
+        return max(metrics.horizontalAdvance(label) for label in self._labels) + self.leader_length
+
     def __radius(self) -> int:
-        return (min(self.width(), self.height()) - self.padding * 2) // 2
-    
+        width = self.viewport().width() - self.__label_width() * 2
+        return max((min(width, self.viewport().height()) - self.padding * 2) // 2, 0)
+
+    def __angles(self) -> list[tuple[float, float]]:
+        total = sum(self._values)
+        if not total:
+            return []
+
+        angles = []
+        start_angle = self._start_angle
+        for value in self._values:
+            angle = (value / total) * pi * 2
+            angles.append((start_angle, angle))
+            start_angle += angle
+        return angles
+
+    def label_layout(self) -> list[LabelPlacement]:
+        width, height = self.viewport().width(), self.viewport().height()
+        key = width, height, self._revision, self.font().key()
+        if key == self._label_layout_key:
+            return self._label_layout
+
+        angles = self.__angles()
+        count = min(len(self._labels), len(angles))
+        self._label_layout = place_labels(
+            [start + angle / 2 for start, angle in angles[:count]],
+            self._values[:count],
+            self._labels[:count],
+            (width / 2, height / 2),
+            self.__radius(),
+            QFontMetrics(self.font()).height(),
+            self.padding,
+            height - self.padding,
+            self.leader_length,
+        )
+        self._label_layout_key = key
+        return self._label_layout
+
     def draw_arcs(self) -> QPainterPath:
         self._scene.clear()
+        self._scene.setSceneRect(0, 0, self.viewport().width(), self.viewport().height())
         cx, cy = self.scene().sceneRect().center().toTuple()
+        radius = self.__radius()
 
         colors = [QColor("#f00"), QColor("#0f0"), QColor("#00f")]
-        for i, value in enumerate(self._values):
-            
+        for i, (start_angle, angle) in enumerate(self.__angles()):
             path = QPainterPath()
-            start_angle = self._start_angle
-
-            angle = (value / sum(self._values)) * pi * 2
-            if i != 0:
-                start_angle += (sum(self._values[:i]) / sum(self._values)) * pi * 2
 
-            arc_x = cx + self.__radius() * cos(start_angle)
-            arc_y = cy - self.__radius() * sin(start_angle)
+            arc_x = cx + radius * cos(start_angle)
+            arc_y = cy - radius * sin(start_angle)
 
             path.moveTo(arc_x, arc_y)
-            path.arcTo(QRect(arc_x, arc_y, self.__radius(), self.__radius()), degrees(start_angle), degrees(angle))
-            self._scene.addPath(path, QPen(colors[i]))
-        
-    def resizeEvent(self, event: QResizeEvent) -> None:
-        self.draw_arcs()
-        return super().resizeEvent(event)
-    
+            path.arcTo(QRectF(cx - radius, cy - radius, radius * 2, radius * 2), degrees(start_angle), degrees(angle))
+            self._scene.addPath(path, QPen(colors[i % len(colors)]))
+
+        self.draw_labels()
 
-import sys
-from PySide6.QtWidgets import QApplication
+    def draw_labels(self) -> None:
+        metrics = QFontMetrics(self.font())
+        pen = QPen(self.label_color.lighter(200))
 
-def main():
-    app = QApplication(sys.argv)
-    p = PieChart([1, 1, 2])
-    p.show()
-    sys.exit(app.exec())
+        for placement in self.label_layout():
+            path = QPainterPath(QPointF(*placement.anchor))
+            path.lineTo(QPointF(*placement.elbow))
+            x, y = placement.position
+            path.lineTo(QPointF(x - 4 if placement.right else x + 4, placement.elbow[1]))
+            self._scene.addPath(path, pen)
 
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+            item = self._scene.addSimpleText(placement.text, self.font())
+            item.setBrush(QBrush(self.label_color))
+            item.setPos(x if placement.right else x - metrics.horizontalAdvance(placement.text), y)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self.draw_arcs()
+        return super().resizeEvent(event)
@@ -0,0 +1,267 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable
+
+import shiboken6
+from PySide6.QtCore import QObject, QThread, Signal, Slot, QCoreApplication
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class CompletionIndex:
+    """Prefix and trigram index over a list of completion entries.
+
+    Prefix matches are found with a binary search over the sorted keys, substring matches by intersecting
+    the trigram posting sets of the query. Entries can be added incrementally: new keys are sorted on their own
+    and merged into the sorted list, the merge of large batches happens outside the lock queries take.
+    """
+
+    insort_limit: int = 64
+
+    def __init__(self, entries: Iterable[str] = (), case_sensitive: bool = False) -> None:
+        self._case_sensitive = case_sensitive
+        self._lock = threading.Lock()
+        self._add_lock = threading.Lock()
+
+        self._entries: list[str] = []
+        self._keys: list[str] = []
+        self._sorted: list[tuple[str, int]] = []
+        self._trigrams: dict[str, set[int]] = {}
+
+        self.add(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def case_sensitive(self) -> bool:
+        return self._case_sensitive
+
+    def key(self, text: str) -> str:
+        return text if self._case_sensitive else text.casefold()
+
+    def add(self, entries: Iterable[str]) -> None:
+        new_entries = list(entries)
+        if not new_entries:
+            return
+
+        new_keys = [self.key(entry) for entry in new_entries]
+
+        with self._add_lock:
+            start = len(self._entries)
+            new_sorted = sorted((key, start + offset) for offset, key in enumerate(new_keys))
+
+            postings: dict[str, list[int]] = {}
+            for offset, key in enumerate(new_keys):
+                for trigram in trigrams(key):
+                    postings.setdefault(trigram, []).append(start + offset)
+
+            merged = None
+            if len(new_sorted) > self.insort_limit:
+                # Both lists are sorted runs, so timsort merges them in linear time.
+                merged = self._sorted + new_sorted
+                merged.sort()
+
+            with self._lock:
+                self._entries.extend(new_entries)
+                self._keys.extend(new_keys)
+                for trigram, indices in postings.items():
+                    self._trigrams.setdefault(trigram, set()).update(indices)
+
+                if merged is not None:
+                    self._sorted = merged
+                else:
+                    for item in new_sorted:
+                        insort(self._sorted, item)
+
+    def clear(self) -> None:
+        with self._add_lock, self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._sorted.clear()
+            self._trigrams.clear()
+
+    def prefix(self, text: str, limit: int = 50) -> list[str]:
+        key = self.key(text)
+        with self._lock:
+            start = bisect_left(self._sorted, (key,))
+            end = bisect_right(self._sorted, (key + "\U0010ffff",), start)
+            return [self._entries[index] for _, index in self._sorted[start : min(end, start + limit)]]
+
+    def query(self, text: str, limit: int = 50, cancelled=lambda: False) -> list[str]:
+        """Returns prefix matches followed by substring matches.
+
+        Args:
+            text      (str)     : Text typed so far.
+            limit     (int)     : Maximum number of results.
+            cancelled (callable): Polled between steps, aborts the query when it returns True.
+        """
+        if not text:
+            return []
+
+        results = self.prefix(text, limit)
+        if len(results) >= limit or len(text) < 3 or cancelled():
+            return results
+
+        key = self.key(text)
+        seen = set(results)
+        with self._lock:
+            postings = []
+            for trigram in trigrams(key):
+                posting = self._trigrams.get(trigram)
+                if not posting:
+                    return results
+                postings.append(posting)
+
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if cancelled():
+                    return results
+                candidates &= posting
+
+            for checked, index in enumerate(sorted(candidates)):
+                if checked % 1024 == 0 and cancelled():
+                    return results
+                entry = self._entries[index]
+                if entry in seen or key not in self._keys[index]:
+                    continue
+                results.append(entry)
+                seen.add(entry)
+                if len(results) >= limit:
+                    break
+
+        return results
+
+
+class _CompletionWorker(QObject):
+    finished = Signal(int, str, list)
+    built = Signal(int, object)
+
+    def __init__(self, completer: "Completer") -> None:
+        super().__init__()
+        self._completer = completer
+
+    @Slot(int, str)
+    def run(self, generation: int, text: str) -> None:
+        def cancelled() -> bool:
+            return generation != self._completer.generation()
+
+        if cancelled():
+            return
+        results = self._completer.index().query(text, self._completer.limit, cancelled)
+        if not cancelled():
+            self.finished.emit(generation, text, results)
+
+    @Slot(int, object, bool)
+    def build(self, generation: int, entries: list, case_sensitive: bool) -> None:
+        # Adding in batches gives the GUI thread the GIL between batches and lets a newer build abort this one
+        index = CompletionIndex(case_sensitive=case_sensitive)
+        for start in range(0, len(entries), self._completer.build_batch_size):
+            if generation != self._completer.build_generation():
+                return
+            index.add(entries[start : start + self._completer.build_batch_size])
+        self.built.emit(generation, index)
+
+
+class Completer(QObject):
+    """Runs CompletionIndex queries on a worker thread.
+
+    Every request supersedes the previous one; stale requests are skipped or aborted by the worker
+    and their results are never delivered. Entries passed to set_entries are indexed on the worker thread as well;
+    requests made while building are held back and answered from the new index once it is ready.
+    """
+
+    results_ready = Signal(str, list)
+    index_ready = Signal()
+    requested = Signal(int, str)
+    build_requested = Signal(int, object, bool)
+
+    limit: int = 50
+    build_batch_size: int = 32768
+
+    def __init__(self, index: CompletionIndex = None, parent: QObject = None) -> None:
+        super().__init__(parent)
+
+        self._index = index if index is not None else CompletionIndex()
+        self._generation = 0
+        self._build_generation = 0
+        self._building = False
+        self._waiting_text = None
+
+        self._thread = QThread()
+        self._worker = _CompletionWorker(self)
+        self._worker.moveToThread(self._thread)
+        thread = self._thread
+
+        self.requested.connect(self._worker.run)
+        self.build_requested.connect(self._worker.build)
+        self._worker.finished.connect(self.__on_finished)
+        self._worker.built.connect(self.__on_built)
+        self._thread.start()
+
+        self.destroyed.connect(lambda: Completer.__stop_thread(thread))
+        if QCoreApplication.instance() is not None:
+            QCoreApplication.instance().aboutToQuit.connect(self.stop)
+
+    def index(self) -> CompletionIndex:
+        return self._index
+
+    def set_index(self, index: CompletionIndex) -> None:
+        """Replaces the index right away, superseding an index still being built by set_entries."""
+        text = self._waiting_text
+        self._index = index
+        self._build_generation += 1
+        self._building = False
+        self.cancel()
+        if text is not None:
+            self.request(text)
+
+    def set_entries(self, entries: Iterable[str]) -> None:
+        """Builds a new index of entries on the worker thread and replaces the current index once it is complete."""
+        self._build_generation += 1
+        self._building = True
+        self.cancel()
+        self.build_requested.emit(self._build_generation, list(entries), self._index.case_sensitive())
+
+    def is_building(self) -> bool:
+        return self._building
+
+    def generation(self) -> int:
+        return self._generation
+
+    def build_generation(self) -> int:
+        return self._build_generation
+
+    def request(self, text: str) -> None:
+        self._generation += 1
+        if self._building:
+            self._waiting_text = text
+            return
+        self.requested.emit(self._generation, text)
+
+    def cancel(self) -> None:
+        self._generation += 1
+        self._waiting_text = None
+
+    def stop(self) -> None:
+        self.cancel()
+        self._thread.quit()
+        self._thread.wait()
+
+    @staticmethod
+    def __stop_thread(thread: QThread) -> None:
+        if shiboken6.isValid(thread):
+            thread.quit()
+            thread.wait()
+
+    def __on_finished(self, generation: int, text: str, results: list) -> None:
+        if generation == self._generation:
+            self.results_ready.emit(text, results)
+
+    def __on_built(self, generation: int, index: CompletionIndex) -> None:
+        if generation != self._build_generation:
+            return
+        self.set_index(index)
+        self.index_ready.emit()
@@ -1,9 +1,17 @@
-from PySide6.QtWidgets import QWidget, QLineEdit, QVBoxLayout, QLabel, QHBoxLayout, QDoubleSpinBox, QSpinBox
-from PySide6.QtGui import QPainter, QPaintEvent, QColor
-from PySide6.QtCore import Qt
+from typing import TYPE_CHECKING, Any, Iterable, Union
+
+from PySide6.QtWidgets import QWidget, QLineEdit, QVBoxLayout, QLabel, QHBoxLayout, QDoubleSpinBox, QSpinBox, QCompleter
+from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, QObject, Signal, QStringListModel
+
+if TYPE_CHECKING:
+    from completion import CompletionIndex, Completer
+    from validation import FieldValidator, Validator
 
 
 class TextInput(QWidget):
+    error_color: QColor = QColor("#eb2347")
+
     def __init__(self, label: str, parent: QWidget = None) -> None:
         super().__init__(parent)
 
@@ -24,8 +32,92 @@ class TextInput(QWidget):
         self.label = QLabel(label)
         self.input = QLineEdit()
 
+        self._completer = None
+        self._popup = None
+
+        self._label_text = label
+        self._error = False
+        self._error_text = None
+        self._validator = None
+
         self.set_vertical()
 
+    def validator(self) -> "FieldValidator":
+        if self._validator is None:
+            from validation import FieldValidator
+
+            self._validator = FieldValidator(self.value, self)
+            self._validator.validated.connect(lambda valid, error_text: self.set_error(not valid, error_text or None))
+            self.input.textChanged.connect(self._validator.schedule)
+        return self._validator
+
+    def add_validator(self, validator: "Validator", asynchronous: bool = False) -> None:
+        self.validator().add_validator(validator, asynchronous)
+
+    def set_error(self, error: bool, error_text: str = None) -> None:
+        self._error = error
+        if error_text is not None:
+            self._error_text = error_text
+
+        self.label.setText(self._error_text if self._error and self._error_text is not None else self._label_text)
+        self.label.setStyleSheet(f"color: {self.error_color.name()};" if self._error else "")
+        self.input.setStyleSheet(f"border: 1px solid {self.error_color.name()};" if self._error else "")
+
+    def completer(self) -> "Completer":
+        return self._completer
+
+    def set_completions(self, entries: Iterable[str]) -> None:
+        """Replaces the completion entries, the index is built on the completer's worker thread."""
+        if self._completer is None:
+            from completion import CompletionIndex
+
+            self.set_completion_index(CompletionIndex())
+        self._completer.set_entries(entries)
+
+    def set_completion_index(self, index: "CompletionIndex") -> None:
+        if self._completer is None:
+            from completion import Completer
+
+            self._completer = Completer(index, self)
+            self._completer.results_ready.connect(self.__show_completions)
+
+            self._popup = QCompleter(QStringListModel(self), self)
+            self._popup.setWidget(self.input)
+            self._popup.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+            self._popup.activated.connect(self.input.setText)
+
+            self.input.textEdited.connect(self.__request_completions)
+        else:
+            self._completer.set_index(index)
+
+    def __request_completions(self, text: str) -> None:
+        if not text:
+            self._completer.cancel()
+            self._popup.popup().hide()
+            return
+        self._completer.request(text)
+
+    def __show_completions(self, text: str, results: list) -> None:
+        if text != self.input.text():
+            return
+        self._popup.model().setStringList(results)
+        if results:
+            self._popup.complete()
+        else:
+            self._popup.popup().hide()
+
+    def value(self) -> str:
+        return self.input.text()
+
+    def set_value(self, value: str) -> None:
+        self.input.setText(str(value))
+
+    def normalize(self, value: Any) -> str:
+        return str(value)
+
+    def block_signals(self, block: bool) -> bool:
+        return self.input.blockSignals(block)
+
     def set_vertical(self) -> None:
         while self.v_layout.count():
             self.v_layout.takeAt(0)
@@ -47,6 +139,8 @@ class TextInput(QWidget):
 
 
 class NumberInput(QWidget):
+    error_color: QColor = QColor("#eb2347")
+
     def __init__(self, label: str, floating_point: bool = False, parent: QWidget = None) -> None:
         super().__init__(parent)
 
@@ -68,18 +162,63 @@ class NumberInput(QWidget):
         self.input_float = QDoubleSpinBox()
         self.input = QSpinBox()
 
+        self._label_text = label
+        self._error = False
+        self._error_text = None
+        self._validator = None
+
         self.set_floating_point(floating_point)
         self.set_vertical()
 
+    def validator(self) -> "FieldValidator":
+        if self._validator is None:
+            from validation import FieldValidator
+
+            self._validator = FieldValidator(self.value, self)
+            self._validator.validated.connect(lambda valid, error_text: self.set_error(not valid, error_text or None))
+            self.input.valueChanged.connect(self._validator.schedule)
+            self.input_float.valueChanged.connect(self._validator.schedule)
+        return self._validator
+
+    def add_validator(self, validator: "Validator", asynchronous: bool = False) -> None:
+        self.validator().add_validator(validator, asynchronous)
+
+    def set_error(self, error: bool, error_text: str = None) -> None:
+        self._error = error
+        if error_text is not None:
+            self._error_text = error_text
+
+        self.label.setText(self._error_text if self._error and self._error_text is not None else self._label_text)
+        self.label.setStyleSheet(f"color: {self.error_color.name()};" if self._error else "")
+        for spin_box in (self.input, self.input_float):
+            spin_box.setStyleSheet(f"border: 1px solid {self.error_color.name()};" if self._error else "")
+
     def set_range(self, low: float, high: float) -> None:
         self.input.setRange(low, high)
         self.input_float.setRange(low, high)
 
+    def value(self) -> float:
+        if self._floating_point:
+            return self.input_float.value()
+        return self.input.value()
+
     def set_value(self, value: float) -> None:
         self.input.setValue(value)
         self.input_float.setValue(value)
 
+    def normalize(self, value: float) -> float:
+        """Returns value as the visible spin box would store it: rounded or truncated, then clamped to its range."""
+        if self._floating_point:
+            value = round(float(value), self.input_float.decimals())
+            return min(max(value, self.input_float.minimum()), self.input_float.maximum())
+        return min(max(int(value), self.input.minimum()), self.input.maximum())
+
+    def block_signals(self, block: bool) -> bool:
+        self.input_float.blockSignals(block)
+        return self.input.blockSignals(block)
+
     def set_floating_point(self, floating_point: bool) -> None:
+        self._floating_point = floating_point
         self.input.setVisible(not floating_point)
         self.input_float.setVisible(floating_point)
 
@@ -103,21 +242,93 @@ class NumberInput(QWidget):
         self.h_layout.addWidget(self.input)
 
 
-import sys
-from PySide6.QtWidgets import QApplication
+class InputBinding(QObject):
+    """Applies and extracts the values of a group of inputs in one go.
 
+    Values are written with the input signals blocked and the affected windows repainted once at the end.
+    Incoming values are normalized the way the widgets store them, and only fields whose normalized value
+    differs from the widget are written and emitted.
+    """
 
-def main():
-    app = QApplication(sys.argv)
-    w = QWidget()
-    w.setLayout(QVBoxLayout())
-    ti = TextInput("Vorname")
-    ni = NumberInput("Linienstärke")
-    w.layout().addWidget(ti)
-    w.layout().addWidget(ni)
-    w.show()
-    sys.exit(app.exec())
+    values_changed = Signal(dict)
 
+    def __init__(self, inputs: dict[str, Union[TextInput, NumberInput]], parent: QObject = None) -> None:
+        super().__init__(parent)
 
-if __name__ == "__main__":
-    main()
+        self._inputs = dict(inputs)
+        self._bound = {name: field.value() for name, field in self._inputs.items()}
+
+    def inputs(self) -> dict[str, Union[TextInput, NumberInput]]:
+        return self._inputs
+
+    def bind(self, values: Any) -> dict[str, Any]:
+        """Writes values to the inputs.
+
+        Args:
+            values (dict | numpy.ndarray): Mapping of field names to values or a structured array record.
+
+        Returns:
+            dict: The normalized values of the fields that were actually written.
+        """
+        normalized = {name: self._inputs[name].normalize(value) for name, value in self.__as_dict(values).items()}
+        changed = {name: value for name, value in normalized.items() if self._inputs[name].value() != value}
+        windows = {self._inputs[name].window() for name in changed}
+        updates_enabled = {window: window.updatesEnabled() for window in windows}
+
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            for name, value in changed.items():
+                field = self._inputs[name]
+                blocked = field.block_signals(True)
+                try:
+                    field.set_value(value)
+                finally:
+                    field.block_signals(blocked)
+                normalized[name] = field.value()
+        finally:
+            for window, enabled in updates_enabled.items():
+                window.setUpdatesEnabled(enabled)
+
+        # Fields already holding the value are not written but still count as bound
+        self._bound.update(normalized)
+
+        written = {name: normalized[name] for name in changed}
+        if written:
+            self.values_changed.emit(written)
+        return written
+
+    def extract(self, dirty_only: bool = False) -> dict[str, Any]:
+        if dirty_only:
+            return self.dirty()
+        return {name: field.value() for name, field in self._inputs.items()}
+
+    def dirty(self) -> dict[str, Any]:
+        """Returns the fields whose value changed since the last bind."""
+        values = {}
+        for name, field in self._inputs.items():
+            value = field.value()
+            if value != self._bound[name]:
+                values[name] = value
+        return values
+
+    def is_dirty(self) -> bool:
+        return bool(self.dirty())
+
+    def mark_clean(self) -> None:
+        self._bound = self.extract()
+
+    def __as_dict(self, values: Any) -> dict[str, Any]:
+        names = getattr(getattr(values, "dtype", None), "names", None)
+        if names is not None:
+            if getattr(values, "size", 1) != 1:
+                raise ValueError(f"InputBinding.bind expects a single record, got {values.size}.")
+            record = values.reshape(-1)[0] if getattr(values, "ndim", 0) else values
+            values = {name: record[name] for name in names}
+
+        result = {}
+        for name, value in values.items():
+            if name not in self._inputs:
+                continue
+            result[name] = value.item() if hasattr(value, "item") else value
+        return result
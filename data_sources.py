@@ -0,0 +1,291 @@
+import csv
+import io
+import os
+from typing import Any, Callable, Union
+
+import numpy as np
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+Progress = Callable[[float], None]
+Cancelled = Callable[[], bool]
+
+CHUNK_SIZE = 1 << 20
+
+
+def _column_index(header: list[str], column: Union[int, str]) -> int:
+    if isinstance(column, int):
+        return column
+    if column not in header:
+        raise KeyError(f"Column {column!r} not found in {header}.")
+    return header.index(column)
+
+
+def _csv_rows(path: str, delimiter: str, progress: Progress, cancelled: Cancelled):
+    """Yields parsed CSV rows while reporting the fraction of bytes consumed."""
+    size = max(os.path.getsize(path), 1)
+    consumed = 0
+    reported = 0
+
+    def lines(file: io.BufferedReader):
+        nonlocal consumed, reported
+        for line in file:
+            consumed += len(line)
+            if consumed - reported >= CHUNK_SIZE:
+                reported = consumed
+                if cancelled():
+                    raise InterruptedError("Loading was cancelled.")
+                progress(consumed / size)
+            yield line.decode("utf-8", errors="replace")
+
+    with open(path, "rb") as file:
+        yield from csv.reader(lines(file), delimiter=delimiter)
+    progress(1.0)
+
+
+class _Decimator:
+    """Keeps at most max_points evenly strided points of a stream of unknown length."""
+
+    def __init__(self, max_points: int) -> None:
+        self._max_points = max(max_points - max_points % 2, 2)
+        self._stride = 1
+        self._count = 0
+        self.x: list[float] = []
+        self.y: list[float] = []
+
+    def add(self, y: float) -> None:
+        if self._count % self._stride == 0:
+            if len(self.x) == self._max_points:
+                self.x, self.y = self.x[::2], self.y[::2]
+                self._stride *= 2
+            if self._count % self._stride == 0:
+                self.x.append(self._count)
+                self.y.append(y)
+        self._count += 1
+
+
+def read_csv_totals(
+    path: str,
+    category_column: Union[int, str],
+    value_column: Union[int, str] = None,
+    delimiter: str = ",",
+    header: bool = True,
+    progress: Progress = lambda fraction: None,
+    cancelled: Cancelled = lambda: False,
+) -> dict[str, float]:
+    """Sums a value column per category while streaming through a CSV file.
+
+    Args:
+        path            (str)       : CSV file to read.
+        category_column (int | str) : Index or header name of the category column.
+        value_column    (int | str) : Index or header name of the value column, rows are counted if omitted.
+        delimiter       (str)       : Field delimiter.
+        header          (bool)      : Whether the first row is a header.
+        progress        (callable)  : Called with the fraction of the file read so far.
+        cancelled       (callable)  : Polled while reading, raises InterruptedError when it returns True.
+    """
+    rows = _csv_rows(path, delimiter, progress, cancelled)
+    names = next(rows, []) if header else []
+    category_index = _column_index(names, category_column)
+    value_index = _column_index(names, value_column) if value_column is not None else None
+
+    totals: dict[str, float] = {}
+    for row in rows:
+        if len(row) <= category_index or value_index is not None and len(row) <= value_index:
+            continue
+        try:
+            value = float(row[value_index]) if value_index is not None else 1.0
+        except ValueError:
+            continue
+        category = row[category_index]
+        totals[category] = totals.get(category, 0.0) + value
+
+    return totals
+
+
+def read_csv_series(
+    path: str,
+    column: Union[int, str],
+    max_points: int = 4096,
+    delimiter: str = ",",
+    header: bool = True,
+    progress: Progress = lambda fraction: None,
+    cancelled: Cancelled = lambda: False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reads an evenly strided sample of at most max_points values of a CSV column.
+
+    Returns:
+        tuple: Row numbers and values of the sampled rows.
+    """
+    rows = _csv_rows(path, delimiter, progress, cancelled)
+    names = next(rows, []) if header else []
+    index = _column_index(names, column)
+
+    decimator = _Decimator(max_points)
+    for row in rows:
+        try:
+            decimator.add(float(row[index]))
+        except (IndexError, ValueError):
+            continue
+
+    return np.asarray(decimator.x), np.asarray(decimator.y)
+
+
+def read_binary_totals(
+    path: str,
+    dtype: np.dtype,
+    category_field: str,
+    value_field: str = None,
+    labels: list[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+    progress: Progress = lambda fraction: None,
+    cancelled: Cancelled = lambda: False,
+) -> dict[Any, float]:
+    """Sums a value field per integer category code of a memory mapped file of fixed size records.
+
+    Args:
+        path           (str)       : File of records laid out as dtype.
+        dtype          (np.dtype)  : Structured record type.
+        category_field (str)       : Field holding non negative integer category codes.
+        value_field    (str)       : Field summed per category, records are counted if omitted.
+        labels         (list[str]) : Names of the category codes, the codes are used as keys if omitted.
+        chunk_size     (int)       : Number of records aggregated at once.
+    """
+    if os.path.getsize(path) == 0:
+        progress(1.0)
+        return {}
+
+    records = np.memmap(path, dtype=np.dtype(dtype), mode="r")
+    totals = np.zeros(0)
+
+    for start in range(0, records.size, chunk_size):
+        if cancelled():
+            raise InterruptedError("Loading was cancelled.")
+        chunk = records[start : start + chunk_size]
+        weights = chunk[value_field] if value_field is not None else None
+        counts = np.bincount(chunk[category_field], weights=weights)
+        if counts.size > totals.size:
+            totals = np.pad(totals, (0, counts.size - totals.size))
+        totals[: counts.size] += counts
+        progress(min(start + chunk_size, records.size) / records.size)
+
+    del records
+    return {labels[code] if labels is not None else code: float(total) for code, total in enumerate(totals) if total}
+
+
+def read_binary_series(
+    path: str,
+    dtype: np.dtype,
+    field: str = None,
+    max_points: int = 4096,
+    progress: Progress = lambda fraction: None,
+    cancelled: Cancelled = lambda: False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduces a memory mapped column to the minimum and maximum of max_points / 2 buckets, preserving peaks.
+
+    Returns:
+        tuple: Record indices and values of the bucket extremes, in record order.
+    """
+    if os.path.getsize(path) == 0:
+        progress(1.0)
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    records = np.memmap(path, dtype=np.dtype(dtype), mode="r")
+    values = records[field] if field is not None else records
+    buckets = max(min(max_points // 2, values.size), 1)
+    edges = np.linspace(0, values.size, buckets + 1).astype(np.int64)
+
+    x = np.empty(buckets * 2, dtype=np.int64)
+    y = np.empty(buckets * 2, dtype=np.float64)
+    for bucket in range(buckets):
+        if bucket % 64 == 0:
+            if cancelled():
+                raise InterruptedError("Loading was cancelled.")
+            progress(bucket / buckets)
+        start, end = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        chunk = values[start:end]
+        low, high = int(chunk.argmin()), int(chunk.argmax())
+        first, second = sorted((low, high))
+        x[bucket * 2], x[bucket * 2 + 1] = start + first, start + second
+        y[bucket * 2], y[bucket * 2 + 1] = chunk[first], chunk[second]
+    progress(1.0)
+
+    del values, records
+    return x, y
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, loader: "DataLoader", generation: int, function: Callable, args: tuple, kwargs: dict) -> None:
+        super().__init__()
+
+        self._loader = loader
+        self._generation = generation
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self._reported = -1.0
+
+    def cancelled(self) -> bool:
+        return self._generation != self._loader.generation()
+
+    def progress(self, fraction: float) -> None:
+        if fraction - self._reported >= 0.01 or fraction == 1.0:
+            self._reported = fraction
+            self._loader.progress_reported.emit(self._generation, fraction)
+
+    def run(self) -> None:
+        try:
+            result = self._function(*self._args, progress=self.progress, cancelled=self.cancelled, **self._kwargs)
+        except InterruptedError:
+            return
+        except Exception as exception:
+            self._loader.load_failed.emit(self._generation, str(exception))
+            return
+        self._loader.load_finished.emit(self._generation, result)
+
+
+class DataLoader(QObject):
+    """Runs one of the read_* functions in the global thread pool and reports through signals.
+
+    Starting a new load cancels the previous one; signals of cancelled loads are never delivered.
+    """
+
+    progress = Signal(float)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    progress_reported = Signal(int, float)
+    load_finished = Signal(int, object)
+    load_failed = Signal(int, str)
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+
+        self._generation = 0
+        self._running = False
+
+        self.progress_reported.connect(lambda generation, fraction: self.__forward(generation, self.progress, fraction))
+        self.load_finished.connect(lambda generation, result: self.__forward(generation, self.finished, result, done=True))
+        self.load_failed.connect(lambda generation, error: self.__forward(generation, self.failed, error, done=True))
+
+    def generation(self) -> int:
+        return self._generation
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def load(self, function: Callable, *args: Any, **kwargs: Any) -> None:
+        self._generation += 1
+        self._running = True
+        QThreadPool.globalInstance().start(_LoadTask(self, self._generation, function, args, kwargs))
+
+    def cancel(self) -> None:
+        self._generation += 1
+        self._running = False
+
+    def __forward(self, generation: int, signal: Signal, value: Any, done: bool = False) -> None:
+        if generation != self._generation:
+            return
+        if done:
+            self._running = False
+        signal.emit(value)
@@ -0,0 +1,160 @@
+"""Interactive demos of the widgets, kept out of the widget modules so importing them stays cheap.
+
+    python demo.py slider
+"""
+
+import argparse
+import sys
+
+from PySide6.QtWidgets import QApplication, QWidget, QGridLayout, QVBoxLayout, QHBoxLayout
+from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt
+
+
+def button_demo() -> QWidget:
+    from button import Button
+
+    w = QWidget()
+    w.setLayout(QGridLayout())
+    w.layout().setAlignment(Qt.AlignmentFlag.AlignTop)
+
+    b1 = Button("Zoom in", "zoom-in")
+    b1.primary_color = QColor("#34495e")
+
+    b2 = Button("Zoom out", "zoom-out")
+    b2.primary_color = QColor("#34495e")
+
+    b3 = Button("Test", "zap")
+    b3.primary_color = QColor("#f26957")
+
+    b4 = Button("Test", "briefcase")
+    b4.primary_color = QColor("#3265d1")
+
+    b5 = Button("Test")
+
+    b6 = Button("Test", "chevron-down")
+    b6.set_svg("chevron-up", True)
+    b6.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
+
+    b7 = Button("Datei auswählen", "file-csv")
+    b7.primary_color = QColor("#af51cf")
+    b4.clicked.connect(lambda: b7.set_error(not b7._error, "Falscher Dateityp!"))
+
+    b8 = Button("Test", "volume")
+    b8.setCheckable(True)
+    b8.set_svg("volume-x", True)
+
+    w.layout().addWidget(b1, 0, 0)
+    w.layout().addWidget(b2, 0, 1)
+    w.layout().addWidget(b3, 1, 0)
+    w.layout().addWidget(b4, 1, 1)
+    w.layout().addWidget(b5, 2, 0)
+    w.layout().addWidget(b6, 2, 1)
+    w.layout().addWidget(b7, 3, 0)
+    w.layout().addWidget(b8, 3, 1)
+    return w
+
+
+def slider_demo() -> QWidget:
+    from button import Button
+    from slider import Slider
+
+    w = QWidget()
+    w.setLayout(QVBoxLayout())
+    b = Button(svg_name="volume-x", svg_name_alternate="volume")
+    b.setChecked(True)
+    b.set_uniform_border_radius(200)
+
+    s0 = Slider()
+    s0.set_suffix("%")
+    s0.set_range_text_visible(False)
+
+    h = QHBoxLayout()
+    h.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
+    h.addWidget(b)
+    h.addWidget(s0)
+
+    def on_volume_changed(volume: int) -> None:
+        b.setChecked(volume != 0)
+
+    def on_button_clicked(checked: bool) -> None:
+        if not checked:
+            b.stored_volume = s0.value()
+            s0.set_value(0)
+        else:
+            s0.set_value(b.stored_volume if hasattr(b, "stored_volume") else s0.extent() // 2)
+        b.update()
+
+    s0.value_changed.connect(on_volume_changed)
+    b.clicked.connect(on_button_clicked)
+
+    w.layout().addLayout(h)
+    return w
+
+
+def data_input_demo() -> QWidget:
+    from data_input import TextInput, NumberInput
+
+    w = QWidget()
+    w.setLayout(QVBoxLayout())
+    ti = TextInput("Vorname")
+    ni = NumberInput("Linienstärke")
+    w.layout().addWidget(ti)
+    w.layout().addWidget(ni)
+    return w
+
+
+def charts_demo() -> QWidget:
+    from charts import PieChart
+
+    return PieChart([1, 1, 2])
+
+
+def histogram_slider_demo() -> QWidget:
+    import numpy as np
+    from histogram_slider import HistogramSlider
+
+    s = HistogramSlider(np.random.default_rng().normal(size=5_000_000))
+    s.range_changed.connect(lambda low, high: print(f"{low:.2f} - {high:.2f}"))
+    return s
+
+
+def icon_picker_demo() -> QWidget:
+    from data_input import TextInput
+    from icon_picker import IconPicker
+
+    w = QWidget()
+    w.setLayout(QVBoxLayout())
+    search = TextInput("Suche")
+    picker = IconPicker()
+    search.input.textChanged.connect(picker.set_filter)
+    picker.icon_selected.connect(print)
+    w.layout().addWidget(search)
+    w.layout().addWidget(picker)
+    return w
+
+
+DEMOS = {
+    "button": button_demo,
+    "slider": slider_demo,
+    "data_input": data_input_demo,
+    "charts": charts_demo,
+    "histogram_slider": histogram_slider_demo,
+    "icon_picker": icon_picker_demo,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show a widget demo.")
+    parser.add_argument("demo", choices=DEMOS)
+    arguments, qt_arguments = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_arguments)
+    w = DEMOS[arguments.demo]()
+    w.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
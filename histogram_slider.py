@@ -0,0 +1,303 @@
+import warnings
+
+import numpy as np
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import Qt, QPoint, QPointF, QRect, QSize, QTimer, Signal
+from PySide6.QtGui import QColor, QBrush, QPainter, QPaintEvent, QPixmap, QMouseEvent, QResizeEvent
+
+
+def histogram(data: np.ndarray, minimum: float, maximum: float, bins: int, sample_size: int = 2_000_000, chunk_size: int = 1_000_000) -> np.ndarray:
+    """Counts the values of data in uniform bins between minimum and maximum.
+
+    Arrays larger than sample_size are binned from an evenly strided sample. The sample is processed in chunks so
+    the temporary index arrays never exceed chunk_size elements.
+
+    Args:
+        data        (np.ndarray): Values to bin, any shape.
+        minimum     (float)     : Lower edge of the first bin.
+        maximum     (float)     : Upper edge of the last bin.
+        bins        (int)       : Number of bins.
+        sample_size (int)       : Maximum number of values to bin.
+        chunk_size  (int)       : Number of values binned at once.
+    """
+    counts = np.zeros(bins, dtype=np.int64)
+    if bins <= 0 or maximum <= minimum:
+        return counts
+
+    values = data.reshape(-1)
+    if values.size > sample_size:
+        values = values[:: -(-values.size // sample_size)]
+
+    scale = bins / (maximum - minimum)
+    for start in range(0, values.size, chunk_size):
+        chunk = values[start : start + chunk_size]
+        chunk = chunk[(chunk >= minimum) & (chunk <= maximum)]
+        indices = ((chunk - minimum) * scale).astype(np.intp)
+        np.minimum(indices, bins - 1, out=indices)
+        counts += np.bincount(indices, minlength=bins)
+
+    return counts
+
+
+class HistogramSlider(QWidget):
+    """Range slider with two thumbs drawing the density of a NumPy array behind its track.
+
+    The histogram is counted once per data and range at histogram_resolution bins and averaged down to the
+    track's pixel width, so resizing only redraws the cached pixmaps. range_changed is emitted at most once per event loop pass.
+    """
+
+    primary_color: QColor = QColor("#008f9b")
+    secondary_color: QColor = QColor("#d3d3d3")
+
+    padding_h: int = 16
+    padding_v: int = 8
+    gap: int = 4
+
+    range_changed = Signal(float, float)
+    slider_pressed = Signal()
+    slider_released = Signal()
+
+    histogram_height: int = 48
+    track_height: int = 8
+    thumb_radius: int = 8
+
+    sample_size: int = 2_000_000
+    histogram_resolution: int = 4096
+
+    def __init__(self, data: np.ndarray = None, parent: QWidget = None) -> None:
+        super().__init__(parent)
+
+        self._data = np.empty(0)
+        self._revision = 0
+
+        self._minimum, self._maximum = 0.0, 1.0
+        self._lower, self._upper = 0.0, 1.0
+
+        self._counts_key = None
+        self._counts = None
+        self._histogram_key = None
+        self._histogram_pixmaps = None
+
+        self._hovered = None
+        self._pressed = None
+
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(lambda: self.range_changed.emit(self._lower, self._upper))
+
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum)
+
+        if data is not None:
+            self.set_data(data)
+
+    def data(self) -> np.ndarray:
+        return self._data
+
+    def set_data(self, data: np.ndarray) -> None:
+        self._data = np.asarray(data)
+        self._revision += 1
+
+        if self._data.size:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                minimum, maximum = float(np.nanmin(self._data)), float(np.nanmax(self._data))
+            if np.isfinite(minimum) and np.isfinite(maximum):
+                self.set_range(minimum, maximum)
+        self.update()
+
+    def range(self) -> tuple[float, float]:
+        return self._minimum, self._maximum
+
+    def set_range(self, minimum: float, maximum: float) -> None:
+        if maximum <= minimum:
+            maximum = minimum + 1
+        self._minimum, self._maximum = minimum, maximum
+        self.set_values(minimum, maximum)
+        self.update()
+
+    def extent(self) -> float:
+        return self._maximum - self._minimum
+
+    def lower_value(self) -> float:
+        return self._lower
+
+    def upper_value(self) -> float:
+        return self._upper
+
+    def values(self) -> tuple[float, float]:
+        return self._lower, self._upper
+
+    def set_values(self, lower: float, upper: float) -> None:
+        lower = min(max(lower, self._minimum), self._maximum)
+        upper = min(max(upper, self._minimum), self._maximum)
+        if lower > upper:
+            lower, upper = upper, lower
+        if (lower, upper) == (self._lower, self._upper):
+            return
+        self._lower, self._upper = lower, upper
+        self._emit_timer.start()
+        self.update()
+
+    def selection_mask(self) -> np.ndarray:
+        return (self._data >= self._lower) & (self._data <= self._upper)
+
+    def sizeHint(self) -> QSize:
+        return QSize(
+            max(self.padding_h, self.thumb_radius) * 2 + 200,
+            self.padding_v * 2 + self.histogram_height + self.gap + max(self.track_height, self.thumb_radius * 2),
+        )
+
+    def __track_rect(self) -> QRect:
+        left = max(self.padding_h, self.thumb_radius)
+        top = self.padding_v + self.histogram_height + self.gap + max(self.thumb_radius - self.track_height // 2, 0)
+        return QRect(left, top, self.width() - left * 2, self.track_height)
+
+    def __histogram_rect(self) -> QRect:
+        track = self.__track_rect()
+        return QRect(track.left(), self.padding_v, track.width(), self.histogram_height)
+
+    def __value_to_x(self, value: float) -> float:
+        track = self.__track_rect()
+        return track.left() + (value - self._minimum) / self.extent() * track.width()
+
+    def __transform_position_to_value(self, point: QPointF) -> float:
+        track = self.__track_rect()
+        return self._minimum + (point.x() - track.left()) / max(track.width(), 1) * self.extent()
+
+    def __thumb_rect(self, value: float) -> QRect:
+        center = QPoint(round(self.__value_to_x(value)), self.__track_rect().center().y())
+        return QRect(center.x() - self.thumb_radius, center.y() - self.thumb_radius, self.thumb_radius * 2, self.thumb_radius * 2)
+
+    def __thumb_at(self, point: QPointF) -> str:
+        distances = {
+            "lower": abs(point.x() - self.__value_to_x(self._lower)),
+            "upper": abs(point.x() - self.__value_to_x(self._upper)),
+        }
+        thumb = min(distances, key=distances.get)
+        if distances["lower"] == distances["upper"]:
+            thumb = "lower" if point.x() < self.__value_to_x(self._lower) else "upper"
+        if abs(point.y() - self.__track_rect().center().y()) > self.thumb_radius or distances[thumb] > self.thumb_radius:
+            return None
+        return thumb
+
+    def __histogram_counts(self, bins: int) -> np.ndarray:
+        resolution = max(self.histogram_resolution, bins)
+        key = self._revision, self._minimum, self._maximum, resolution
+        if key != self._counts_key:
+            self._counts_key = key
+            self._counts = histogram(self._data, self._minimum, self._maximum, resolution, self.sample_size)
+        if bins <= 0:
+            return np.zeros(0)
+
+        # Columns cover an uneven number of bins unless resolution is a multiple of bins, average instead of summing
+        edges = np.arange(bins + 1) * resolution // bins
+        return np.add.reduceat(self._counts, edges[:-1]) / np.diff(edges)
+
+    def __histogram_pixmaps(self) -> tuple[QPixmap, QPixmap]:
+        rect = self.__histogram_rect()
+        key = self._revision, self._minimum, self._maximum, rect.width(), rect.height(), self.devicePixelRatioF()
+        if key == self._histogram_key:
+            return self._histogram_pixmaps
+
+        ratio = self.devicePixelRatioF()
+        bins = max(round(rect.width() * ratio), 0)
+        counts = self.__histogram_counts(bins)
+        peak = counts.max() if counts.size else 0
+        heights = np.ceil(counts / peak * rect.height() * ratio).astype(int) if peak else np.zeros(bins, dtype=int)
+
+        pixmaps = []
+        for color in (self.secondary_color, self.primary_color):
+            pixmap = QPixmap(max(bins, 1), max(round(rect.height() * ratio), 1))
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QBrush(color))
+            for x in np.flatnonzero(heights):
+                painter.drawRect(int(x), pixmap.height() - int(heights[x]), 1, int(heights[x]))
+            painter.end()
+            pixmap.setDevicePixelRatio(ratio)
+            pixmaps.append(pixmap)
+
+        self._histogram_key = key
+        self._histogram_pixmaps = tuple(pixmaps)
+        return self._histogram_pixmaps
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        position = event.position()
+        if self._pressed is not None and event.buttons() == Qt.MouseButton.LeftButton:
+            value = self.__transform_position_to_value(position)
+            if self._pressed == "lower":
+                self.set_values(min(value, self._upper), self._upper)
+            else:
+                self.set_values(self._lower, max(value, self._lower))
+        else:
+            hovered = self.__thumb_at(position)
+            if hovered != self._hovered:
+                self._hovered = hovered
+                self.update()
+            self.setCursor(Qt.CursorShape.PointingHandCursor if hovered else Qt.CursorShape.ArrowCursor)
+
+        return super().mouseMoveEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.buttons() == Qt.MouseButton.LeftButton:
+            self._pressed = self.__thumb_at(event.position())
+            if self._pressed is not None:
+                self.setCursor(Qt.CursorShape.ClosedHandCursor)
+                self.slider_pressed.emit()
+                self.update()
+
+        return super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if self._pressed is not None:
+            self._pressed = None
+            self.slider_released.emit()
+            self.update()
+        self.setCursor(Qt.CursorShape.PointingHandCursor if self._hovered else Qt.CursorShape.ArrowCursor)
+        return super().mouseReleaseEvent(event)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self.update()
+        return super().resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        histogram_rect = self.__histogram_rect()
+        background, highlighted = self.__histogram_pixmaps()
+        painter.drawPixmap(histogram_rect.topLeft(), background)
+
+        lower_x, upper_x = self.__value_to_x(self._lower), self.__value_to_x(self._upper)
+        painter.save()
+        painter.setClipRect(QRect(round(lower_x), histogram_rect.top(), round(upper_x - lower_x) + 1, histogram_rect.height()))
+        painter.drawPixmap(histogram_rect.topLeft(), highlighted)
+        painter.restore()
+
+        track = self.__track_rect()
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        painter.setBrush(QBrush(self.secondary_color))
+        painter.drawRoundedRect(track, self.track_height // 2, self.track_height // 2)
+
+        painter.setBrush(QBrush(self.primary_color))
+        painter.drawRoundedRect(
+            QRect(round(lower_x), track.top(), round(upper_x - lower_x), self.track_height), self.track_height // 2, self.track_height // 2
+        )
+
+        for thumb, value in (("lower", self._lower), ("upper", self._upper)):
+            color = self.primary_color
+            if not self.isEnabled():
+                color = color.darker(250)
+            elif self._pressed == thumb:
+                color = color.lighter(110)
+            elif self._hovered == thumb:
+                color = color.darker(120)
+            painter.setBrush(QBrush(color))
+            painter.drawEllipse(self.__thumb_rect(value))
+
+        return super().paintEvent(event)
@@ -0,0 +1,227 @@
+import os
+from collections import OrderedDict
+
+from PySide6.QtWidgets import QAbstractScrollArea, QWidget
+from PySide6.QtCore import Qt, QPoint, QRect, QSize, QEvent, Signal
+from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPixmap, QMouseEvent, QResizeEvent, QBrush
+
+from utils import ICONS_FOLDER, load_svg, draw_svg
+
+
+def icon_names(folder: str = ICONS_FOLDER) -> list[str]:
+    with os.scandir(folder) as entries:
+        return sorted(entry.name[:-4] for entry in entries if entry.name.endswith(".svg"))
+
+
+def fuzzy_score(query: str, name: str) -> int:
+    """Scores name as a fuzzy match for query, or returns -1 if the characters of query are not a subsequence of name.
+
+    Consecutive characters and characters at the start of a word score higher.
+    """
+    score = 0
+    position = -1
+    for character in query:
+        index = name.find(character, position + 1)
+        if index < 0:
+            return -1
+        if index == position + 1:
+            score += 3
+        if index == 0 or name[index - 1] in "-_ ":
+            score += 2
+        score += 1
+        position = index
+    return score * 100 - len(name)
+
+
+class IconIndex:
+    """Fuzzy search over icon names that narrows the previous result set while the query is extended."""
+
+    def __init__(self, names: list[str]) -> None:
+        self._names = names
+        self._keys = [name.casefold() for name in names]
+        self._query = ""
+        self._candidates = list(range(len(names)))
+
+    def names(self) -> list[str]:
+        return self._names
+
+    def search(self, query: str) -> list[str]:
+        query = query.casefold().strip()
+        if not query:
+            self._query, self._candidates = "", list(range(len(self._names)))
+            return list(self._names)
+
+        candidates = self._candidates if self._query and query.startswith(self._query) else range(len(self._names))
+        scored = []
+        for index in candidates:
+            score = fuzzy_score(query, self._keys[index])
+            if score >= 0:
+                scored.append((-score, index))
+        scored.sort()
+
+        self._query = query
+        self._candidates = sorted(index for _, index in scored)
+        return [self._names[index] for _, index in scored]
+
+
+class IconPicker(QAbstractScrollArea):
+    """Grid of the icons in ICONS_FOLDER that only paints the visible cells.
+
+    Tiles are rasterized on first paint and kept in a bounded cache, so opening the picker costs a directory listing.
+    """
+
+    primary_color: QColor = QColor("#008f9b")
+    secondary_color: QColor = QColor("#3d3d3d")
+    background_color: QColor = QColor("#ffffff")
+
+    icon_selected = Signal(str)
+
+    cell_size: int = 48
+    icon_size: int = 24
+    spacing: int = 4
+    cache_size: int = 1024
+
+    def __init__(self, names: list[str] = None, parent: QWidget = None) -> None:
+        super().__init__(parent)
+
+        self._index = IconIndex(names if names is not None else icon_names())
+        self._names = self._index.names()
+        self._tiles: OrderedDict = OrderedDict()
+
+        self._hovered = -1
+        self._selected = None
+
+        self.viewport().setMouseTracking(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(self.cell_size // 2)
+
+    def names(self) -> list[str]:
+        return self._names
+
+    def selected(self) -> str:
+        return self._selected
+
+    def set_selected(self, name: str) -> None:
+        self._selected = name
+        self.viewport().update()
+
+    def set_filter(self, text: str) -> None:
+        self._names = self._index.search(text)
+        self._hovered = -1
+        self.verticalScrollBar().setValue(0)
+        self.__update_scroll_bar()
+        self.viewport().update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(self.__pitch() * 8 + self.spacing, self.__pitch() * 6 + self.spacing)
+
+    def __pitch(self) -> int:
+        return self.cell_size + self.spacing
+
+    def __columns(self) -> int:
+        return max((self.viewport().width() - self.spacing) // self.__pitch(), 1)
+
+    def __update_scroll_bar(self) -> None:
+        rows = -(-len(self._names) // self.__columns())
+        content_height = rows * self.__pitch() + self.spacing
+        self.verticalScrollBar().setRange(0, max(content_height - self.viewport().height(), 0))
+        self.verticalScrollBar().setPageStep(self.viewport().height())
+
+    def __cell_rect(self, index: int) -> QRect:
+        row, column = divmod(index, self.__columns())
+        return QRect(
+            self.spacing + column * self.__pitch(),
+            self.spacing + row * self.__pitch() - self.verticalScrollBar().value(),
+            self.cell_size,
+            self.cell_size,
+        )
+
+    def __index_at(self, point: QPoint) -> int:
+        x, y = point.x() - self.spacing, point.y() + self.verticalScrollBar().value() - self.spacing
+        if x < 0 or y < 0 or x % self.__pitch() >= self.cell_size or y % self.__pitch() >= self.cell_size:
+            return -1
+        column = x // self.__pitch()
+        if column >= self.__columns():
+            return -1
+        index = (y // self.__pitch()) * self.__columns() + column
+        return index if index < len(self._names) else -1
+
+    def __tile(self, name: str, color: QColor) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        key = name, color.rgba(), self.icon_size, ratio
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        tile = QPixmap(QSize(self.icon_size, self.icon_size) * ratio)
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(tile)
+        draw_svg(painter, load_svg(name), QSize(self.icon_size, self.icon_size), QRect(0, 0, self.icon_size + 1, self.icon_size + 1), color)
+        painter.end()
+
+        self._tiles[key] = tile
+        if len(self._tiles) > self.cache_size:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        hovered = self.__index_at(event.position().toPoint())
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self.viewport().setCursor(Qt.CursorShape.PointingHandCursor if hovered >= 0 else Qt.CursorShape.ArrowCursor)
+            self.viewport().setToolTip(self._names[hovered] if hovered >= 0 else "")
+            self.viewport().update()
+        return super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event: QEvent) -> None:
+        self._hovered = -1
+        self.viewport().update()
+        return super().leaveEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        index = self.__index_at(event.position().toPoint())
+        if index >= 0 and event.button() == Qt.MouseButton.LeftButton:
+            self.set_selected(self._names[index])
+            self.icon_selected.emit(self._selected)
+        return super().mouseReleaseEvent(event)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self.__update_scroll_bar()
+        return super().resizeEvent(event)
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        self.viewport().update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(event.rect(), self.background_color)
+
+        columns = self.__columns()
+        offset = self.verticalScrollBar().value()
+        first_row = max((offset + event.rect().top() - self.spacing) // self.__pitch(), 0)
+        last_row = (offset + event.rect().bottom()) // self.__pitch()
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        for index in range(first_row * columns, min((last_row + 1) * columns, len(self._names))):
+            name = self._names[index]
+            rect = self.__cell_rect(index)
+            color = self.secondary_color
+
+            if name == self._selected:
+                painter.setBrush(QBrush(self.primary_color))
+                painter.drawRoundedRect(rect, 4, 4)
+                color = self.background_color
+            elif index == self._hovered:
+                painter.setBrush(QBrush(self.primary_color.lighter(190)))
+                painter.drawRoundedRect(rect, 4, 4)
+
+            tile = self.__tile(name, color)
+            margin = (self.cell_size - self.icon_size) // 2
+            painter.drawPixmap(rect.left() + margin, rect.top() + margin, tile)
+
+        if not self._names:
+            painter.setPen(self.secondary_color)
+            painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter, "No icons found")
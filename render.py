@@ -0,0 +1,219 @@
+"""Renders widget configurations offscreen to PNG, optionally comparing them against stored baselines.
+
+The spec file is a JSON list of widget configurations:
+
+    [
+        {
+            "name": "button-zoom-in",
+            "widget": "Button",
+            "size": [160, 56],
+            "args": ["Zoom in", "zoom-in"],
+            "attributes": {"primary_color": "#34495e"},
+            "calls": [["setChecked", true]]
+        }
+    ]
+
+"widget" is one of the aliases in WIDGETS or a "module:Class" path. Attributes that hold a QColor on the widget
+are converted from their string value. Work is spread over a process pool with one QApplication per worker.
+Renders without a baseline fail the comparison, baselines are only written with --update-baselines.
+
+    python render.py specs.json --output renders --baseline baselines --update-baselines
+    python render.py specs.json --output renders --baseline baselines
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pathlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any
+
+WIDGETS = {
+    "Button": "button:Button",
+    "Slider": "slider:Slider",
+    "HistogramSlider": "histogram_slider:HistogramSlider",
+    "PieChart": "charts:PieChart",
+    "TextInput": "data_input:TextInput",
+    "NumberInput": "data_input:NumberInput",
+}
+
+_app = None
+
+
+def _initialize_worker() -> None:
+    global _app
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+    from PySide6.QtWidgets import QApplication
+
+    _app = QApplication.instance() or QApplication([])
+
+
+def _widget_class(name: str) -> type:
+    path = WIDGETS.get(name, name)
+    if path.count(":") != 1:
+        raise KeyError(f"Unknown widget {name!r}, expected one of {', '.join(WIDGETS)} or a 'module:Class' path.")
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _check_name(name: str) -> None:
+    separators = {"/", "\\", os.sep, os.altsep} - {None}
+    if not name or name in (".", "..") or any(separator in name for separator in separators):
+        raise ValueError(f"Spec name {name!r} must be a plain file name without path separators.")
+
+
+def create_widget(spec: dict[str, Any]):
+    """Creates and configures the widget described by a spec entry."""
+    from PySide6.QtGui import QColor
+
+    widget = _widget_class(spec["widget"])(*spec.get("args", []), **spec.get("kwargs", {}))
+
+    for name, value in spec.get("attributes", {}).items():
+        if isinstance(getattr(widget, name, None), QColor):
+            value = QColor(value)
+        setattr(widget, name, value)
+
+    for method, *args in spec.get("calls", []):
+        getattr(widget, method)(*args)
+
+    size = spec.get("size")
+    if size:
+        widget.resize(*size)
+    else:
+        widget.resize(widget.sizeHint())
+    return widget
+
+
+def compare_images(image, baseline, tolerance: int = 0) -> tuple[float, Any]:
+    """Compares two QImages pixel by pixel.
+
+    Args:
+        image     (QImage): Rendered image.
+        baseline  (QImage): Stored baseline.
+        tolerance (int)   : Largest per channel difference still considered equal.
+
+    Returns:
+        tuple: Fraction of differing pixels and a QImage marking them in red, or (1.0, None) if the sizes differ.
+    """
+    import numpy as np
+    from PySide6.QtGui import QImage
+
+    if image.size() != baseline.size():
+        return 1.0, None
+
+    def pixels(source: QImage) -> np.ndarray:
+        converted = source.convertToFormat(QImage.Format.Format_RGBA8888)
+        array = np.frombuffer(converted.constBits(), dtype=np.uint8).reshape(converted.height(), converted.bytesPerLine())
+        return array[:, : converted.width() * 4].reshape(converted.height(), converted.width(), 4).copy()
+
+    difference = np.abs(pixels(image).astype(np.int16) - pixels(baseline).astype(np.int16)).max(axis=2) > tolerance
+
+    mask = np.zeros((*difference.shape, 4), dtype=np.uint8)
+    mask[difference] = (255, 0, 0, 255)
+    diff_image = QImage(mask.data, mask.shape[1], mask.shape[0], mask.shape[1] * 4, QImage.Format.Format_RGBA8888).copy()
+
+    return float(difference.mean()) if difference.size else 0.0, diff_image
+
+
+def render(job: tuple[dict[str, Any], str, str, int, bool]) -> dict[str, Any]:
+    spec, output, baseline_folder, tolerance, update_baselines = job
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage
+    from PySide6.QtWidgets import QWidget
+    import shiboken6
+
+    name = spec["name"]
+    result = {"name": name, "path": str(pathlib.Path(output, f"{name}.png")), "difference": None, "missing_baseline": False, "error": None}
+    try:
+        _check_name(name)
+        widget = create_widget(spec)
+        image = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        QWidget.render(widget, image)
+        shiboken6.delete(widget)
+        image.save(result["path"])
+
+        if baseline_folder is not None:
+            baseline_path = pathlib.Path(baseline_folder, f"{name}.png")
+            if update_baselines:
+                image.save(str(baseline_path))
+                result["difference"] = 0.0
+            elif not baseline_path.exists():
+                result["missing_baseline"] = True
+            else:
+                difference, diff_image = compare_images(image, QImage(str(baseline_path)), tolerance)
+                result["difference"] = difference
+                if difference and diff_image is not None:
+                    diff_image.save(str(pathlib.Path(output, f"{name}.diff.png")))
+    except Exception as exception:
+        result["error"] = f"{type(exception).__name__}: {exception}"
+
+    return result
+
+
+def render_all(
+    specs: list[dict[str, Any]],
+    output: str,
+    baseline: str = None,
+    workers: int = None,
+    tolerance: int = 0,
+    update_baselines: bool = False,
+) -> list[dict[str, Any]]:
+    """Renders every spec in a pool of worker processes and returns one result per spec, in order."""
+    pathlib.Path(output).mkdir(parents=True, exist_ok=True)
+    if baseline is not None and update_baselines:
+        pathlib.Path(baseline).mkdir(parents=True, exist_ok=True)
+
+    for index, spec in enumerate(specs):
+        spec.setdefault("name", f"{index:05d}-{spec['widget'].split(':')[-1].lower()}")
+
+    jobs = [(spec, output, baseline, tolerance, update_baselines) for spec in specs]
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(len(jobs) // (workers * 8), 1)
+
+    with ProcessPoolExecutor(workers, mp_context=get_context("spawn"), initializer=_initialize_worker) as executor:
+        return list(executor.map(render, jobs, chunksize=chunk_size))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Render widget configurations offscreen to PNG.")
+    parser.add_argument("spec", help="JSON file with a list of widget configurations.")
+    parser.add_argument("-o", "--output", default="renders", help="Folder the images are written to.")
+    parser.add_argument("-b", "--baseline", help="Folder with baseline images to compare against.")
+    parser.add_argument("-j", "--workers", type=int, help="Number of worker processes, defaults to the number of cores.")
+    parser.add_argument("--tolerance", type=int, default=0, help="Largest per channel difference still considered equal.")
+    parser.add_argument("--threshold", type=float, default=0.0, help="Fraction of differing pixels still considered a match.")
+    parser.add_argument("--update-baselines", action="store_true", help="Overwrite the baselines with the new renders.")
+    arguments = parser.parse_args()
+    if arguments.update_baselines and arguments.baseline is None:
+        parser.error("--update-baselines requires --baseline")
+
+    with open(arguments.spec, encoding="utf-8") as file:
+        specs = json.load(file)
+
+    results = render_all(specs, arguments.output, arguments.baseline, arguments.workers, arguments.tolerance, arguments.update_baselines)
+
+    failures = 0
+    for result in results:
+        if result["error"] is not None:
+            failures += 1
+            print(f"ERROR    {result['name']}: {result['error']}")
+        elif result["missing_baseline"]:
+            failures += 1
+            print(f"NEW      {result['name']}: no baseline, run with --update-baselines to store it")
+        elif result["difference"] is not None and result["difference"] > arguments.threshold:
+            failures += 1
+            print(f"MISMATCH {result['name']}: {result['difference']:.2%} of pixels differ")
+
+    print(f"{len(results)} rendered, {failures} failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
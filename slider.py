@@ -1,8 +1,197 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QHBoxLayout
+import copy
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
 from PySide6.QtCore import Qt, QPoint, QRect, QSize, Signal
-from PySide6.QtGui import QColor, QGuiApplication, QBrush, QPainter, QPaintEvent, QFontMetrics, QFont, QMouseEvent, QWheelEvent, QResizeEvent
+from PySide6.QtGui import QColor, QGuiApplication, QBrush, QPainter, QPaintEvent, QMouseEvent, QWheelEvent, QResizeEvent
 
-from button import Button
+from utils import static_text, draw_static_text
+
+
+def decimals_of(value: float) -> int:
+    return max(str(value)[::-1].find("."), 0)
+
+
+@lru_cache(maxsize=4096)
+def format_value(value: float, decimals: int) -> str:
+    if decimals == 0:
+        return str(int(value))
+    return str(round(value, decimals))
+
+
+class ValueMapping(ABC):
+    """Maps slider values to track positions in [0, 1] and snaps them to the allowed values."""
+
+    @abstractmethod
+    def minimum(self) -> float: ...
+
+    @abstractmethod
+    def maximum(self) -> float: ...
+
+    @abstractmethod
+    def decimals(self) -> int: ...
+
+    @abstractmethod
+    def snap(self, value: float) -> float: ...
+
+    @abstractmethod
+    def offset(self, value: float, steps: int) -> float: ...
+
+    @abstractmethod
+    def to_position(self, value: float) -> float: ...
+
+    @abstractmethod
+    def to_value(self, position: float) -> float: ...
+
+    @abstractmethod
+    def with_range(self, minimum: float, maximum: float) -> "ValueMapping":
+        """Returns a mapping of the same kind restricted to or rebuilt for the range between minimum and maximum."""
+
+    def text(self, value: float) -> str:
+        return format_value(value, self.decimals())
+
+
+class LinearMapping(ValueMapping):
+    def __init__(self, minimum: float, maximum: float, step: float = 1) -> None:
+        self._minimum, self._maximum = minimum, maximum
+        self._step = step
+        self._decimals = decimals_of(step)
+
+    def minimum(self) -> float:
+        return self._minimum
+
+    def maximum(self) -> float:
+        return self._maximum
+
+    def decimals(self) -> int:
+        return self._decimals
+
+    def snap(self, value: float) -> float:
+        return self._step * round(value / self._step)
+
+    def offset(self, value: float, steps: int) -> float:
+        return min(max(self.snap(value + steps * self._step), self._minimum), self._maximum)
+
+    def to_position(self, value: float) -> float:
+        if self._maximum == self._minimum:
+            return 0.0
+        return (value - self._minimum) / (self._maximum - self._minimum)
+
+    def to_value(self, position: float) -> float:
+        return self._minimum + position * (self._maximum - self._minimum)
+
+    def with_range(self, minimum: float, maximum: float) -> "LinearMapping":
+        return LinearMapping(minimum, maximum, self._step)
+
+
+class TickMapping(ValueMapping):
+    """Snaps to an explicit table of allowed values with a binary search.
+
+    Args:
+        ticks     (Iterable[float]): Allowed values.
+        positions (Sequence[float]): Track position of each sorted tick, evenly spaced if omitted.
+        decimals  (int)            : Decimals used for labels, derived from the ticks if omitted.
+    """
+
+    def __init__(self, ticks: Iterable[float], positions: Sequence[float] = None, decimals: int = None) -> None:
+        ticks = sorted(set(ticks))
+        if not ticks:
+            raise ValueError("TickMapping needs at least one tick.")
+
+        count = len(ticks)
+        if positions is None:
+            positions = [index / (count - 1) for index in range(count)] if count > 1 else [0.0]
+        if len(positions) != count:
+            raise ValueError("TickMapping needs one position per tick.")
+
+        self._decimals = decimals if decimals is not None else max(decimals_of(tick) for tick in ticks)
+        self._table = ticks, list(positions), [format_value(tick, self._decimals) for tick in ticks]
+        self.__set_window(0, count)
+
+    def __set_window(self, start: int, end: int) -> None:
+        ticks, positions, texts = self._table
+        self._ticks, self._texts = ticks[start:end], texts[start:end]
+
+        first, last = positions[start], positions[end - 1]
+        self._positions = [(position - first) / (last - first) if last > first else 0.0 for position in positions[start:end]]
+
+    def ticks(self) -> list[float]:
+        return self._ticks
+
+    def minimum(self) -> float:
+        return self._ticks[0]
+
+    def maximum(self) -> float:
+        return self._ticks[-1]
+
+    def decimals(self) -> int:
+        return self._decimals
+
+    def index(self, value: float) -> int:
+        index = bisect_left(self._ticks, value)
+        if index == len(self._ticks) or index > 0 and value - self._ticks[index - 1] <= self._ticks[index] - value:
+            index -= 1
+        return index
+
+    def snap(self, value: float) -> float:
+        return self._ticks[self.index(value)]
+
+    def offset(self, value: float, steps: int) -> float:
+        return self._ticks[min(max(self.index(value) + steps, 0), len(self._ticks) - 1)]
+
+    def to_position(self, value: float) -> float:
+        return self._positions[self.index(value)]
+
+    def to_value(self, position: float) -> float:
+        index = bisect_left(self._positions, position)
+        if index == len(self._positions) or index > 0 and position - self._positions[index - 1] <= self._positions[index] - position:
+            index -= 1
+        return self._ticks[index]
+
+    def text(self, value: float) -> str:
+        index = self.index(value)
+        if self._ticks[index] == value:
+            return self._texts[index]
+        return format_value(value, self._decimals)
+
+    def with_range(self, minimum: float, maximum: float) -> "TickMapping":
+        """Returns a view of the ticks between minimum and maximum stretched over the whole track.
+
+        The view keeps the full tick table, so widening the range again restores the ticks outside of it. A range
+        without ticks is clamped to the nearest tick.
+        """
+        ticks = self._table[0]
+        start, end = bisect_left(ticks, minimum), bisect_right(ticks, maximum)
+        if start >= end:
+            if start == len(ticks) or start > 0 and minimum - ticks[start - 1] <= ticks[start] - maximum:
+                start -= 1
+            end = start + 1
+
+        mapping = copy.copy(self)
+        mapping.__set_window(start, end)
+        return mapping
+
+
+class LogarithmicMapping(TickMapping):
+    """Tick table of count values spaced logarithmically between minimum and maximum."""
+
+    def __init__(self, minimum: float, maximum: float, count: int = 1000, decimals: int = 2) -> None:
+        if minimum <= 0 or maximum <= minimum:
+            raise ValueError("LogarithmicMapping needs 0 < minimum < maximum.")
+        if count < 2:
+            raise ValueError("LogarithmicMapping needs at least two ticks.")
+
+        ratio = math.log(maximum / minimum)
+        ticks = sorted({round(minimum * math.exp(ratio * index / (count - 1)), decimals) for index in range(count)})
+        ticks = [tick for tick in ticks if tick > 0]
+        if len(ticks) < 2:
+            raise ValueError(f"LogarithmicMapping between {minimum} and {maximum} rounds to fewer than two ticks with {decimals} decimals.")
+
+        super().__init__(ticks, [math.log(tick / ticks[0]) / math.log(ticks[-1] / ticks[0]) for tick in ticks], decimals)
 
 
 class Slider(QWidget):
@@ -32,6 +221,7 @@ class Slider(QWidget):
         self._minimum, self._maximum = 0, 100
         self._value = 50
         self._step = 1
+        self._mapping = LinearMapping(self._minimum, self._maximum, self._step)
 
         self.setMouseTracking(True)
 
@@ -69,8 +259,9 @@ class Slider(QWidget):
         if minimum > self._maximum:
             self._maximum = minimum + self._step
         self._minimum = minimum
+        self.__update_mapping()
         if not self.contains(self._value):
-            self.set_value(minimum)
+            self.set_value(self._minimum)
 
         self.update()
 
@@ -81,28 +272,39 @@ class Slider(QWidget):
         if maximum < self._minimum:
             self._minimum = maximum - self._step
         self._maximum = maximum
+        self.__update_mapping()
         if not self.contains(self._value):
-            self.set_value(maximum)
+            self.set_value(self._maximum)
+
+        self.update()
+
+    def mapping(self) -> ValueMapping:
+        return self._mapping
 
+    def __update_mapping(self) -> None:
+        self._mapping = self._mapping.with_range(self._minimum, self._maximum)
+        self._minimum, self._maximum = self._mapping.minimum(), self._mapping.maximum()
+
+    def set_mapping(self, mapping: ValueMapping) -> None:
+        self._mapping = mapping
+        self._minimum, self._maximum = mapping.minimum(), mapping.maximum()
+        value = mapping.snap(min(max(self._value, self._minimum), self._maximum))
+        if value != self._value:
+            self._value = value
+            self.value_changed.emit(self._value)
         self.update()
 
     def decimals(self) -> int:
-        return max(str(self._step)[::-1].find("."), 0)
+        return self._mapping.decimals()
 
     def __text(self) -> str:
-        if self.decimals() == 0:
-            return str(int(self._value))
-        return str(round(self._value, self.decimals()))
+        return self._mapping.text(self._value)
 
     def __text_minimum(self) -> str:
-        if self.decimals() == 0:
-            return str(int(self._minimum))
-        return str(round(self._minimum, self.decimals()))
+        return self._mapping.text(self._minimum)
 
     def __text_maximum(self) -> str:
-        if self.decimals() == 0:
-            return str(int(self._maximum))
-        return str(round(self._maximum, self.decimals()))
+        return self._mapping.text(self._maximum)
 
     def value(self) -> float:
         return self._value
@@ -110,7 +312,7 @@ class Slider(QWidget):
     def set_value(self, value: float) -> None:
         if not self.contains(value):
             return
-        new_value = self._step * round(value / self._step)
+        new_value = self._mapping.snap(value)
         if new_value == self._value:
             return
         self._value = new_value
@@ -121,11 +323,14 @@ class Slider(QWidget):
         return self._step
 
     def set_step(self, step: float) -> None:
+        """Only affects linear mappings, tick mappings snap to their own ticks."""
         if step <= 0:
             return
         if step > abs(self._maximum - self._minimum):
             return
         self._step = step
+        if isinstance(self._mapping, LinearMapping):
+            self._mapping = LinearMapping(self._minimum, self._maximum, self._step)
         self.update()
 
     def set_text_visible(self, visible: bool) -> None:
@@ -155,8 +360,8 @@ class Slider(QWidget):
         return max(int(self._show_text) * self.gap, self.thumb_radius)
 
     def get_text_metrics(self, text: str) -> QSize:
-        metrics = QFontMetrics(self.font())
-        return metrics.horizontalAdvance(text + self.suffix()), metrics.height()
+        size = static_text(text + self.suffix(), self.font()).size()
+        return math.ceil(size.width()), math.ceil(size.height())
 
     def __minimum_text_rect(self) -> QRect:
         if not self._show_range:
@@ -177,7 +382,7 @@ class Slider(QWidget):
             return QRect(0, 0, 0, 0)
 
         width, height = self.get_text_metrics(self.__text())
-        x = max(self.padding_h, self.thumb_radius) + (self.value() - self.minimum()) / self.extent() * (
+        x = max(self.padding_h, self.thumb_radius) + self._mapping.to_position(self.value()) * (
             self.width() - max(self.padding_h, self.thumb_radius) * 2
         )
         x -= width // 2
@@ -199,7 +404,7 @@ class Slider(QWidget):
 
     def __thumb_rect(self) -> QRect:
         track = self.__track_rect()
-        thumb_x = track.left() + (self.value() - self.minimum()) / self.extent() * track.width() - self.thumb_radius
+        thumb_x = track.left() + self._mapping.to_position(self.value()) * track.width() - self.thumb_radius
         return QRect(thumb_x, track.center().y() - self.thumb_radius, self.thumb_radius * 2, self.thumb_radius * 2)
 
     def __get_primary_color(self) -> QColor:
@@ -221,7 +426,7 @@ class Slider(QWidget):
 
     def __transform_position_to_value(self, point: QPoint) -> float:
         x = (point.x() - self.__track_rect().left()) / self.__track_rect().width()
-        return self.minimum() + x * self.extent()
+        return self._mapping.to_value(min(max(x, 0.0), 1.0))
 
     def mouse_over_handle(self, point: QPoint) -> bool:
         cx, cy = self.__thumb_rect().center().toTuple()
@@ -259,18 +464,18 @@ class Slider(QWidget):
         return super().mouseReleaseEvent(event)
 
     def wheelEvent(self, event: QWheelEvent) -> None:
-        delta = self._step
+        steps = 1
 
         modifiers = QGuiApplication.queryKeyboardModifiers()
         if modifiers == Qt.ShiftModifier:
-            delta = 10
+            steps = 10
         if modifiers == Qt.ControlModifier:
-            delta = 100
+            steps = 100
 
         if event.angleDelta().y() < 0:
-            self.set_value(self.value() - delta)
+            self.set_value(self._mapping.offset(self.value(), -steps))
         elif event.angleDelta().y() > 0:
-            self.set_value(self.value() + delta)
+            self.set_value(self._mapping.offset(self.value(), steps))
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         self.update()
@@ -283,13 +488,13 @@ class Slider(QWidget):
 
         painter.setPen(self.text_color)
         painter.setFont(self.font())
-        painter.drawText(self.__text_rect(), Qt.AlignmentFlag.AlignCenter, self.__text() + self.suffix())
+        draw_static_text(painter, self.__text_rect(), self.__text() + self.suffix())
 
         if self._show_range:
             painter.setPen(self.text_color.lighter(200))
 
-            painter.drawText(self.__minimum_text_rect(), Qt.AlignmentFlag.AlignCenter, self.__text_minimum() + self.suffix())
-            painter.drawText(self.__maximum_text_rect(), Qt.AlignmentFlag.AlignCenter, self.__text_maximum() + self.suffix())
+            draw_static_text(painter, self.__minimum_text_rect(), self.__text_minimum() + self.suffix())
+            draw_static_text(painter, self.__maximum_text_rect(), self.__text_maximum() + self.suffix())
 
         painter.setPen(Qt.PenStyle.NoPen)
 
@@ -303,48 +508,3 @@ class Slider(QWidget):
         painter.drawEllipse(self.__thumb_rect())
 
         return super().paintEvent(event)
-    
-
-import sys
-from PySide6.QtWidgets import QApplication
-
-
-def main():
-    app = QApplication(sys.argv)
-    w = QWidget()
-    w.setLayout(QVBoxLayout())
-    b = Button(svg_name="volume-x", svg_name_alternate="volume")
-    b.setChecked(True)
-    b.set_uniform_border_radius(200)
-
-    s0 = Slider()
-    s0.set_suffix("%")
-    s0.set_range_text_visible(False)
-
-    h = QHBoxLayout()
-    h.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
-    h.addWidget(b)
-    h.addWidget(s0)
-
-    def on_volume_changed(volume: int) -> None:
-        b.setChecked(volume != 0)
-
-    def on_button_clicked(checked: bool) -> None:
-        if not checked:
-            b.stored_volume = s0.value()
-            s0.set_value(0)
-        else:
-            s0.set_value(b.stored_volume if hasattr(b, "stored_volume") else s0.extent() // 2)
-        b.update()
-
-    s0.value_changed.connect(on_volume_changed)
-    b.clicked.connect(on_button_clicked)
-
-    w.layout().addLayout(h)
-    w.show()
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()
@@ -1,9 +1,13 @@
 import pathlib
-from PySide6.QtGui import QIcon, QPainter, QColor
-from PySide6.QtCore import Qt, QRect, QPoint, QSize
+from collections import OrderedDict
+from PySide6.QtGui import QIcon, QPainter, QFont, QStaticText, QTransform
+from PySide6.QtCore import Qt, QRect, QPoint, QPointF, QSize
 
 ICONS_FOLDER = pathlib.Path(__file__).parent.joinpath("icons")
 
+STATIC_TEXT_CACHE_SIZE = 512
+_static_text_cache: OrderedDict = OrderedDict()
+
 
 def load_svg(svg_name: str) -> QIcon:
     return QIcon(str(ICONS_FOLDER.joinpath(f"{svg_name}.svg")))
@@ -33,3 +37,44 @@ def draw_svg(painter: QPainter, svg: QIcon, size: QSize, rect: QRect, color: str
 
     del i_paint
     del pixmap
+
+
+def static_text(text: str, font: QFont) -> QStaticText:
+    """Returns a prepared text layout, shared across widgets through a bounded LRU cache.
+
+    Args:
+        text (str)  : Plain text to lay out.
+        font (QFont): Font the text is drawn with.
+    """
+    key = text, font.key()
+    prepared = _static_text_cache.get(key)
+    if prepared is not None:
+        _static_text_cache.move_to_end(key)
+        return prepared
+
+    prepared = QStaticText(text)
+    prepared.setTextFormat(Qt.TextFormat.PlainText)
+    prepared.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+    prepared.prepare(QTransform(), font)
+
+    _static_text_cache[key] = prepared
+    if len(_static_text_cache) > STATIC_TEXT_CACHE_SIZE:
+        _static_text_cache.popitem(last=False)
+    return prepared
+
+
+def draw_static_text(painter: QPainter, rect: QRect, text: str) -> None:
+    """Draws text centered in rect with the painter's current font and pen.
+
+    Args:
+        painter (QPainter): The painter used to draw.
+        rect    (QRect)   : Rectangle to center the text in.
+        text    (str)     : Text to draw.
+    """
+    if not text:
+        return
+
+    prepared = static_text(text, painter.font())
+    size = prepared.size()
+    center = QPointF(rect.center()) + QPointF(0.5, 0.5)
+    painter.drawStaticText(QPointF(center.x() - size.width() / 2, center.y() - size.height() / 2), prepared)
@@ -0,0 +1,117 @@
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+Validator = Callable[[Any], Optional[str]]
+
+
+def run_validators(validators: list[Validator], value: Any) -> Optional[str]:
+    """Runs validators in order and returns the first error message, or None if the value is valid."""
+    for validator in validators:
+        try:
+            error = validator(value)
+        except Exception as exception:
+            error = str(exception) or type(exception).__name__
+        if error:
+            return error
+    return None
+
+
+class _ValidationTask(QRunnable):
+    def __init__(self, field_validator: "FieldValidator", generation: int, value: Any, validators: list[Validator]) -> None:
+        super().__init__()
+
+        self._field_validator = field_validator
+        self._generation = generation
+        self._value = value
+        self._validators = validators
+
+    def run(self) -> None:
+        if self._generation != self._field_validator.generation():
+            error = None
+        else:
+            error = run_validators(self._validators, self._value)
+        self._field_validator.finished.emit(self._generation, error)
+
+
+class FieldValidator(QObject):
+    """Debounced validation of a single input.
+
+    Synchronous validators run on the GUI thread once the debounce interval elapsed, asynchronous
+    validators in the global thread pool afterwards. At most one asynchronous validation is in flight;
+    edits made while it runs are validated once it finished and results for stale values are discarded.
+
+    Validators take the value and return an error message, or None if the value is valid.
+    """
+
+    validated = Signal(bool, str)
+    finished = Signal(int, object)
+
+    debounce_interval: int = 300
+
+    def __init__(self, value: Callable[[], Any], parent: QObject = None) -> None:
+        super().__init__(parent)
+
+        self._value = value
+        self._validators: list[Validator] = []
+        self._async_validators: list[Validator] = []
+
+        self._generation = 0
+        self._running = False
+        self._running_generation = 0
+        self._pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.debounce_interval)
+        self._timer.timeout.connect(self.__start)
+
+        self.finished.connect(self.__on_finished)
+
+    def generation(self) -> int:
+        return self._generation
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def add_validator(self, validator: Validator, asynchronous: bool = False) -> None:
+        if asynchronous:
+            self._async_validators.append(validator)
+        else:
+            self._validators.append(validator)
+
+    def set_debounce_interval(self, interval: int) -> None:
+        self._timer.setInterval(interval)
+
+    def schedule(self) -> None:
+        self._generation += 1
+        self._timer.start()
+
+    def validate(self) -> None:
+        self._generation += 1
+        self._timer.stop()
+        self.__start()
+
+    def __start(self) -> None:
+        if self._running:
+            self._pending = self._generation != self._running_generation
+            return
+
+        value = self._value()
+        error = run_validators(self._validators, value)
+        if error or not self._async_validators:
+            self.validated.emit(error is None, error or "")
+            return
+
+        self._running = True
+        self._running_generation = self._generation
+        QThreadPool.globalInstance().start(_ValidationTask(self, self._generation, value, list(self._async_validators)))
+
+    def __on_finished(self, generation: int, error: Optional[str]) -> None:
+        self._running = False
+        pending, self._pending = self._pending, False
+        if generation != self._generation:
+            if pending:
+                self.__start()
+            return
+        self.validated.emit(error is None, error or "")
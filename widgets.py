@@ -0,0 +1,43 @@
+"""Lazily resolved entry point for the widgets.
+
+    from widgets import Button
+
+only imports the module defining Button; the other widget modules and their dependencies, such as NumPy for
+HistogramSlider, are imported on first access.
+"""
+
+import importlib
+
+_MODULES = {
+    "Button": "button",
+    "Slider": "slider",
+    "LinearMapping": "slider",
+    "TickMapping": "slider",
+    "LogarithmicMapping": "slider",
+    "HistogramSlider": "histogram_slider",
+    "TextInput": "data_input",
+    "NumberInput": "data_input",
+    "InputBinding": "data_input",
+    "CompletionIndex": "completion",
+    "Completer": "completion",
+    "FieldValidator": "validation",
+    "PieChart": "charts",
+    "IconPicker": "icon_picker",
+    "DataLoader": "data_sources",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))